@@ -1,7 +1,7 @@
 """Module containing the connection wrapper for the AVR interface."""
 import asyncio
 import logging
-from typing import Callable
+from typing import Callable, List
 
 from .protocol import AVR
 
@@ -23,7 +23,7 @@ class Connection:
         auto_reconnect: bool = True,
         loop: asyncio.AbstractEventLoop = None,
         protocol_class: asyncio.Protocol = AVR,
-        update_callback: Callable[[str], None] = None,
+        update_callback: Callable[[List[str]], None] = None,
     ):
         """Initiate a connection to a specific device.
 
@@ -39,7 +39,8 @@ class Connection:
         :param loop:
             asyncio.loop for async operation
         :param update_callback"
-            This function is called whenever AVR state data changes
+            This function is called with the list of changed datagrams
+            whenever AVR state data changes
 
         :type host:
             str
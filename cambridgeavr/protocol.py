@@ -1,5 +1,6 @@
 """Module to maintain AVR state information and network interface."""
 import asyncio
+import functools
 import logging
 
 __all__ = ["AVR"]
@@ -10,6 +11,21 @@ try:
 except AttributeError:
     ensure_future = getattr(asyncio, "async")
 
+# asyncio.BufferedProtocol was added in Python 3.7; on older interpreters we
+# fall back to asyncio.Protocol and copy received chunks into our own buffer.
+try:
+    BaseProtocol = asyncio.BufferedProtocol
+except AttributeError:
+    BaseProtocol = asyncio.Protocol
+
+RECEIVE_BUFFER_SIZE = 8192
+MIN_READ_SIZE = 1024
+MAX_DATAGRAM_SIZE = 65536
+VOLUME_REFRESH_INTERVAL = 2
+VOLUME_REFRESH_TRIES = 10
+VOLUME_STEP_BATCH = 8
+VOLUME_STEP_TIMEOUT = 2
+
 CMD_SET_POWER_STATE = "1,01"
 POWER_STATE_ON = "1"
 POWER_STATE_OFF = "0"
@@ -35,6 +51,23 @@ CMD_SET_AUDIO_SOURCE = "2,04"
 CMD_SW_VERSION = "5,01"
 CMD_PROTOCOL_VERSION = "5,02"
 
+# Encoded datagrams for the commands which are sent without data
+ENCODED_COMMANDS = {
+    command: f"#{command},\r".encode()
+    for command in (
+        CMD_VOLUME_UP,
+        CMD_VOLUME_DOWN,
+        CMD_BASS_UP,
+        CMD_BASS_DOWN,
+        CMD_TREBLE_UP,
+        CMD_TREBLE_DOWN,
+        CMD_LIP_SYNC_UP,
+        CMD_LIP_SYNC_DOWN,
+        CMD_SW_VERSION,
+        CMD_PROTOCOL_VERSION,
+    )
+}
+
 ATTR_POWER_STATE = "#6,01"
 ATTR_MUTE_STATE = "#6,11"
 ATTR_VOLUME_UP = "#6,02"
@@ -45,6 +78,8 @@ ATTR_MYSTERY = "#7,05"
 ATTR_SW_VERSION = "#10,01"
 ATTR_PROTOCOL_VERSION = "#10,02"
 
+VOLUME_ATTRS = frozenset((ATTR_VOLUME_UP, ATTR_VOLUME_DOWN))
+
 INPUT_NAMES = {
     1: "BD/DVD",
     2: "Video 1",
@@ -58,6 +93,10 @@ INPUT_NAMES = {
 }
 INPUT_NUMBERS = {v: k for k, v in INPUT_NAMES.items()}
 
+# Preformatted CMD_SELECT_INPUT data for every valid input number and name
+INPUT_DATA_BY_NUMBER = {number: f"{number:02d}" for number in range(1, 100)}
+INPUT_DATA = {k: INPUT_DATA_BY_NUMBER[v] for k, v in INPUT_NUMBERS.items()}
+
 LOOKUP = {
     ATTR_POWER_STATE: {
         "name": "power_state",
@@ -81,10 +120,13 @@ LOOKUP = {
         "03": "Video 2",
         "04": "CD/AUX",
         "05": "Tape/MD/CDR",
-        "O6": "Tuner",
-        "O7": "Video 3",
+        "06": "Tuner",
+        "07": "Video 3",
         "08": "Direct In",
         "09": "TV ARC",
+        # Aliases for the letter-O spellings used by earlier releases
+        "O6": "Tuner",
+        "O7": "Video 3",
     },
     ATTR_AUDIO_SOURCE: {
         "name": "audio_source",
@@ -107,6 +149,20 @@ LOOKUP = {
     },
 }
 
+# Name of the private AVR attribute holding the state of each LOOKUP entry
+ATTR_TO_SLOT = {k: "_" + v["name"] for k, v in LOOKUP.items()}
+
+# LOOKUP flattened into (attribute name, description, value names) tuples
+# so _parse_message needs a single lookup per datagram
+LOOKUP_ENTRIES = {
+    k: (
+        ATTR_TO_SLOT[k],
+        v.get("description", k),
+        {kk: vv for kk, vv in v.items() if kk not in ("name", "description")},
+    )
+    for k, v in LOOKUP.items()
+}
+
 
 #
 # Volume and Attenuation handlers. The AVR tracks volume internally as
@@ -119,8 +175,12 @@ LOOKUP = {
 #   - volume (0-100)
 #   - volume_as_percentage (0-1 floating point)
 #
+# Both conversions are pure functions over a small domain, so their results
+# are memoized.
+#
 
 
+@functools.lru_cache(maxsize=256)
 def attenuation_to_volume(value):
     """Convert a native attenuation value to a volume value.
 
@@ -138,6 +198,7 @@ def attenuation_to_volume(value):
         return 0
 
 
+@functools.lru_cache(maxsize=256)
 def volume_to_attenuation(value):
     """Convert a volume value to a native attenuation value.
 
@@ -156,9 +217,38 @@ def volume_to_attenuation(value):
 
 
 # pylint: disable=too-many-instance-attributes, too-many-public-methods
-class AVR(asyncio.Protocol):
+class AVR(BaseProtocol):
     """The Cambridge Audio Azur 551R AVR control protocol handler."""
 
+    __slots__ = (
+        "_loop",
+        "log",
+        "_dbg",
+        "_warn",
+        "_connection_lost_callback",
+        "_update_callback",
+        "_buf",
+        "_view",
+        "_rpos",
+        "_wpos",
+        "_input_names",
+        "_input_numbers",
+        "_poweron_refresh_successful",
+        "_volume_refresh",
+        "_volume_refresh_timer",
+        "_volume_target",
+        "_volume_steps",
+        "_volume_steps_timer",
+        "_volume_steps_deadline",
+        "transport",
+        "_write",
+        "_volume_int",
+        "_power_bool",
+        "_mute_bool",
+        # Device state, one slot per distinct LOOKUP name
+        *dict.fromkeys(ATTR_TO_SLOT.values()),
+    )
+
     def __init__(self, update_callback=None, loop=None, connection_lost_callback=None):
         """Protocol handler that handles all status and changes on AVR.
 
@@ -166,7 +256,8 @@ class AVR(asyncio.Protocol):
         which will maintain the socket and handle auto-reconnects.
 
             :param update_callback:
-                called if any state information changes in device (optional)
+                called with the list of changed datagrams if any state
+                information changes in device (optional)
             :param connection_lost_callback:
                 called when connection is lost to device (optional)
             :param loop:
@@ -181,59 +272,159 @@ class AVR(asyncio.Protocol):
         """
         self._loop = loop
         self.log = logging.getLogger(__name__)
+        self._dbg = self.log.debug
+        self._warn = self.log.warning
         self._connection_lost_callback = connection_lost_callback
         self._update_callback = update_callback
-        self.buffer = ""
+        self._buf = bytearray(RECEIVE_BUFFER_SIZE)
+        self._view = memoryview(self._buf)
+        self._rpos = 0  # start of the first unparsed datagram
+        self._wpos = 0  # end of the received data
         self._input_names = {}
         self._input_numbers = {}
         self._poweron_refresh_successful = False
-        self._volume_update_state = 0  # 0 = Idle, 1 = Requested, 2 = Completed
-        self._volume_update_success = False
+        self._volume_refresh = None
+        self._volume_refresh_timer = None
         self._volume_target = None
+        self._volume_steps = 0  # volume steps sent but not yet reported
+        self._volume_steps_timer = None
+        self._volume_steps_deadline = 0
         self.transport = None
+        self._write = None
+        self._volume_int = -90
+        self._power_bool = False
+        self._mute_bool = False
+
+        for attr_name in ATTR_TO_SLOT.values():
+            setattr(self, attr_name, "")
+
+    def _refresh_volume(self):
+        """Make the AVR report its volume by stepping it down and back up.
+
+        The AVR does not answer volume queries, so we send a volume down
+        command and step back up once the reply arrives.  The pending
+        refresh is tracked as a future which _parse_message resolves.  The
+        AVR ignores commands while it is powering on, so a watchdog timer
+        resends the probe every VOLUME_REFRESH_INTERVAL seconds and cancels
+        the refresh after VOLUME_REFRESH_TRIES attempts.
+        """
+        if self._volume_refresh is not None and not self._volume_refresh.done():
+            return
+
+        self._dbg("Start Refresh Volume")
+        self._volume_refresh = self._loop.create_future()
+        self._volume_refresh.add_done_callback(self._volume_refresh_done)
+        self._volume_refresh_probe(1)
+
+    def _volume_refresh_probe(self, tries):
+        if tries > VOLUME_REFRESH_TRIES:
+            self._volume_refresh.cancel()
+            return
+
+        self._dbg("Refresh Volume Try %s", tries)
+        self.send_command(CMD_VOLUME_DOWN)
+        self._volume_refresh_timer = self._loop.call_later(
+            VOLUME_REFRESH_INTERVAL, self._volume_refresh_probe, tries + 1
+        )
+
+    def _volume_refresh_done(self, future):
+        self._volume_refresh_timer.cancel()
+        if future.cancelled():
+            self._warn("Refresh Volume timed out!")
+        else:
+            self._dbg("Refresh Volume successful.")
 
-        for key in LOOKUP:
-            setattr(self, f"_{LOOKUP[key]['name']}", "")
-
-    def _refresh_volume(self, tries=0):
-        # IDLE
-        if self._volume_update_state == 0:
-            self.log.debug("Start Refresh Volume")
-            self._volume_update_state = 1
-
-        # REQUESTED
-        if self._volume_update_state == 1:
-            if tries < 10:
-                self.log.debug("Refresh Volume Try %s", tries + 1)
-                self.send_command(CMD_VOLUME_DOWN)
-                self._loop.call_later(2, self._refresh_volume, tries + 1)
+    def _step_volume(self):
+        """Send volume steps towards the attenuation target.
+
+        The AVR only changes volume in 1dB steps and reports the new level
+        after each one.  Up to VOLUME_STEP_BATCH steps are sent in a single
+        write and topped up once half of them have been reported.  Changing
+        direction waits until the steps in flight have been reported.  If the
+        AVR stops reporting, the steps in flight expire after
+        VOLUME_STEP_TIMEOUT seconds and the target is dropped.
+        """
+        target = self._volume_target
+        if target is None:
+            return
+
+        pending = self._volume_steps
+        needed = target - (self._volume_int + pending)
+        if needed == 0:
+            if pending == 0:
+                self._volume_target = None
+            return
+        if pending and (needed > 0) != (pending > 0):
+            return
+        if abs(pending) > VOLUME_STEP_BATCH // 2:
+            return
+
+        count = min(abs(needed), VOLUME_STEP_BATCH - abs(pending))
+        if count > 0:
+            if needed > 0:
+                self._volume_steps = pending + count
+                self.send_command(CMD_VOLUME_UP, repeat=count)
             else:
-                self.log.warning("Refresh Volume timed out!")
+                self._volume_steps = pending - count
+                self.send_command(CMD_VOLUME_DOWN, repeat=count)
+            self._extend_volume_steps_deadline()
+
+    def _extend_volume_steps_deadline(self):
+        """Push back the expiry of the volume steps in flight.
+
+        Only the deadline timestamp moves; the single expiry timer is
+        rescheduled when it fires before the deadline has passed.
+        """
+        self._volume_steps_deadline = self._loop.time() + VOLUME_STEP_TIMEOUT
+        if self._volume_steps_timer is None:
+            self._volume_steps_timer = self._loop.call_at(
+                self._volume_steps_deadline, self._check_volume_steps
+            )
 
-        # COMPLETED
-        if self._volume_update_state == 2:
-            self.log.debug("Refresh Volume successful.")
-            self._volume_update_state = 0
+    def _check_volume_steps(self):
+        self._volume_steps_timer = None
+        if not self._volume_steps:
+            return
+
+        if self._loop.time() < self._volume_steps_deadline:
+            self._volume_steps_timer = self._loop.call_at(
+                self._volume_steps_deadline, self._check_volume_steps
+            )
+            return
+
+        self._warn("Volume steps were not reported, dropping attenuation target")
+        self._volume_steps = 0
+        self._volume_target = None
+
+    def _clear_volume_steps(self):
+        self._volume_steps = 0
+        if self._volume_steps_timer is not None:
+            self._volume_steps_timer.cancel()
+            self._volume_steps_timer = None
 
     def _poweron_callback(self):
-        self.log.debug("AVR Powered on")
+        self._dbg("AVR Powered on")
         self._refresh_volume()
 
         self._poweron_refresh_successful = True
 
     def _get_attribute_value(self, attr):
-        attr_name = f"_{LOOKUP[attr]['name']}"
-        if attr_name:
-            return getattr(self, attr_name)
-        else:
-            self.log.error("No attribute name defined for %s", attr)
+        return getattr(self, ATTR_TO_SLOT[attr])
 
     def _set_attribute_value(self, attr, value):
-        attr_name = f"_{LOOKUP[attr]['name']}"
-        if attr_name:
-            return setattr(self, attr_name, value)
-        else:
-            self.log.error("No attribute name defined for %s", attr)
+        setattr(self, ATTR_TO_SLOT[attr], value)
+
+        # Keep the parsed form of frequently read attributes alongside
+        # the raw value so the properties don't convert on every read
+        if attr in VOLUME_ATTRS:
+            try:
+                self._volume_int = int(value)
+            except ValueError:
+                self._volume_int = -90
+        elif attr == ATTR_POWER_STATE:
+            self._power_bool = self._get_boolean(attr)
+        elif attr == ATTR_MUTE_STATE:
+            self._mute_bool = self._get_boolean(attr)
 
     def _get_integer(self, attr):
         try:
@@ -255,10 +446,7 @@ class AVR(asyncio.Protocol):
         if mode == "raw":
             return value
 
-        if attr in LOOKUP and value in LOOKUP[attr]:
-            return LOOKUP[attr][value]
-
-        return value
+        return LOOKUP_ENTRIES[attr][2].get(value, value)
 
     #
     # asyncio network functions
@@ -266,27 +454,57 @@ class AVR(asyncio.Protocol):
 
     def connection_made(self, transport):
         """Called when asyncio.Protocol establishes the network connection."""
-        self.log.debug("Connection established to AVR")
+        self._dbg("Connection established to AVR")
         self.transport = transport
+        self._write = transport.write
 
         # self.transport.set_write_buffer_limits(0)
         limit_low, limit_high = self.transport.get_write_buffer_limits()
-        self.log.debug("Write buffer limits %d to %d", limit_low, limit_high)
+        self._dbg("Write buffer limits %d to %d", limit_low, limit_high)
 
-    def data_received(self, data):
-        """Called when asyncio.Protocol detects received data from network."""
-        self.buffer += data.decode()
-        self.log.debug("Received %d bytes from AVR: %s", len(self.buffer), self.buffer)
+    def get_buffer(self, sizehint):
+        """Called when asyncio.BufferedProtocol needs a buffer to read into.
+
+        Returns a writable view of the unused tail of the receive buffer,
+        compacting or growing the buffer first if less than MIN_READ_SIZE
+        bytes (or the transport's size hint) are free.
+        """
+        sizehint = min(max(sizehint, MIN_READ_SIZE), RECEIVE_BUFFER_SIZE)
+        if len(self._buf) - self._wpos < sizehint:
+            self._compact_buffer()
+            if len(self._buf) - self._wpos < sizehint:
+                buf = bytearray(max(len(self._buf) * 2, self._wpos + sizehint))
+                buf[: self._wpos] = self._view[: self._wpos]
+                self._buf = buf
+                self._view = memoryview(buf)
+        return self._view[self._wpos :]
+
+    def buffer_updated(self, nbytes):
+        """Called when asyncio.BufferedProtocol wrote data into our buffer."""
+        self._wpos += nbytes
+        self._dbg("Received %d bytes from AVR", nbytes)
         self._assemble_buffer()
 
+    def data_received(self, data):
+        """Called when asyncio.Protocol detects received data from network.
+
+        Only used on Python 3.6, where asyncio.BufferedProtocol is missing.
+        """
+        self.get_buffer(len(data))[: len(data)] = data
+        self.buffer_updated(len(data))
+
     def connection_lost(self, exc):
         """Called when asyncio.Protocol loses the network connection."""
-        self.log.warning("Lost connection to receiver")
+        self._warn("Lost connection to receiver")
 
         if exc is not None:
-            self.log.debug(exc)
+            self._dbg(exc)
 
         self.transport = None
+        self._write = None
+        self._rpos = self._wpos = 0
+        self._volume_target = None
+        self._clear_volume_steps()
 
         if self._connection_lost_callback:
             self._loop.call_soon(self._connection_lost_callback)
@@ -294,125 +512,168 @@ class AVR(asyncio.Protocol):
     def _assemble_buffer(self):
         """Split up received data from device into individual commands.
 
-        Data sent by the device is a sequence of datagrams separated by
-        semicolons.  It's common to receive a burst of them all in one
+        Data sent by the device is a sequence of datagrams terminated by
+        carriage returns.  It's common to receive a burst of them all in one
         submission when there's a lot of device activity.  This function
         disassembles the chain of datagrams into individual messages which
-        are then passed on for interpretation.
-        """
-        self.transport.pause_reading()
+        are then passed on for interpretation.  An unterminated trailing
+        datagram is kept in the buffer until the rest of it arrives.
 
-        for message in self.buffer.split("\r"):
-            if message != "":
-                self.log.debug("assembled message %s", message)
-                self._parse_message(message)
-
-        self.buffer = ""
-
-        self.transport.resume_reading()
-        return
+        The update_callback (if one was supplied) is fired once per call with
+        the list of all datagrams which carried new data.
+        """
+        buf = self._buf
+        end = self._wpos
+        start = self._rpos
+        changed = []
+
+        while True:
+            i = buf.find(b"\r", start, end)
+            if i < 0:
+                break
+            if i > start:
+                message = buf[start:i].decode(errors="replace")
+                self._dbg("assembled message %s", message)
+                if self._parse_message(message):
+                    changed.append(message)
+            start = i + 1
+
+        if start == end:
+            self._rpos = self._wpos = 0
+            if len(buf) > RECEIVE_BUFFER_SIZE:
+                # Drop the space grown for an oversized datagram
+                self._buf = bytearray(RECEIVE_BUFFER_SIZE)
+                self._view = memoryview(self._buf)
+        elif end - start > MAX_DATAGRAM_SIZE:
+            self._warn(
+                "Discarding %d bytes of unterminated data from AVR", end - start
+            )
+            self._rpos = self._wpos = 0
+        else:
+            self._rpos = start
+            if start > len(buf) // 2:
+                self._compact_buffer()
+
+        if changed and self._update_callback:
+            # Keep errors in the callback away from the transport, which
+            # would otherwise close the connection
+            try:
+                self._update_callback(changed)
+            except Exception:
+                self.log.exception("Error in update callback")
+
+    def _compact_buffer(self):
+        """Move the unparsed tail of the receive buffer to its front.
+
+        The transport may still hold a view on the buffer, so the bytes are
+        copied in place instead of resizing the bytearray.
+        """
+        pending = self._wpos - self._rpos
+        self._buf[:pending] = self._buf[self._rpos : self._wpos]
+        self._rpos = 0
+        self._wpos = pending
 
     def _parse_message(self, data):
         """Interpret each message datagram from device and do the needful.
 
         This function receives datagrams from _assemble_buffer and inerprets
         what they mean.  It's responsible for maintaining the internal state
-        table for each device attribute and also for firing the update_callback
-        function (if one was supplied)
+        table for each device attribute.  Returns True if the datagram carried
+        new data.
         """
         recognized = False
         newdata = False
 
-        if data.startswith("#11,01"):
-            self.log.warning("Command Group Unknown")
+        # Every datagram starts with a "#<group>,<number>" header, so the
+        # attribute can be looked up directly instead of scanning LOOKUP.
+        comma = data.find(",", data.find(",") + 1)
+        if comma < 0:
+            key, value = data, ""
+        else:
+            key, value = data[:comma], data[comma + 1 :]
+
+        if key == "#11,01":
+            self._warn("Command Group Unknown")
             recognized = True
-        elif data.startswith("#11,02"):
-            self.log.warning("Command Number in Group Unknown")
+        elif key == "#11,02":
+            self._warn("Command Number in Group Unknown")
             recognized = True
-        elif data.startswith("#11,03"):
-            self.log.warning("Command Data Error")
+        elif key == "#11,03":
+            self._warn("Command Data Error")
             recognized = True
         else:
-            for key in LOOKUP:
-                if data.startswith(key):
-                    recognized = True
-
-                    value = data[len(key) + 1 :]
-                    oldvalue = self._get_attribute_value(key)
-                    if oldvalue != value:
-                        changeindicator = "New Value"
-                        newdata = True
-                    else:
-                        changeindicator = "Unchanged"
-
-                    if key in LOOKUP:
-                        if "description" in LOOKUP[key]:
-                            if value in LOOKUP[key]:
-                                self.log.debug(
-                                    "%s: %s (%s) -> %s (%s)",
-                                    changeindicator,
-                                    LOOKUP[key]["description"],
-                                    key,
-                                    LOOKUP[key][value],
-                                    value,
-                                )
-                            else:
-                                self.log.debug(
-                                    "%s: %s (%s) -> %s",
-                                    changeindicator,
-                                    LOOKUP[key]["description"],
-                                    key,
-                                    value,
-                                )
-                    else:
-                        self.log.debug("%s: %s -> %s", changeindicator, key, value)
+            entry = LOOKUP_ENTRIES.get(key)
+            if entry is not None:
+                attr_name, description, value_names = entry
+                recognized = True
 
-                    self._set_attribute_value(key, value)
-                    break
+                if getattr(self, attr_name) != value:
+                    newdata = True
+
+                if self.log.isEnabledFor(logging.DEBUG):
+                    changeindicator = "New Value" if newdata else "Unchanged"
+                    if value in value_names:
+                        self._dbg(
+                            "%s: %s (%s) -> %s (%s)",
+                            changeindicator,
+                            description,
+                            key,
+                            value_names[value],
+                            value,
+                        )
+                    else:
+                        self._dbg(
+                            "%s: %s (%s) -> %s",
+                            changeindicator,
+                            description,
+                            key,
+                            value,
+                        )
 
-            # Poweron update
-            if self.power and not self._poweron_refresh_successful:
-                self._loop.call_soon(self._poweron_callback)
+                self._set_attribute_value(key, value)
 
             # Volume update
-            if data.startswith(ATTR_VOLUME_UP) or data.startswith(ATTR_VOLUME_DOWN):
-                volume = self._get_integer(ATTR_VOLUME_UP)
-                if self._volume_target:
-                    if volume != self._volume_target:
-                        self.send_command(
-                            CMD_VOLUME_UP
-                            if self._volume_target > volume
-                            else CMD_VOLUME_DOWN
-                        )
+            if key in VOLUME_ATTRS:
+                if self._volume_steps:
+                    if self._volume_steps > 0:
+                        self._volume_steps -= 1
                     else:
-                        self._volume_target = None
+                        self._volume_steps += 1
+                    self._extend_volume_steps_deadline()
+                self._step_volume()
 
-                if self._volume_update_state == 1:
+                if self._volume_refresh is not None and not self._volume_refresh.done():
+                    self._volume_refresh.set_result(None)
                     self.send_command(CMD_VOLUME_UP)
-                    self._volume_update_state = 2
 
                 newdata = True
                 recognized = True
 
-        if newdata:
-            if self._update_callback:
-                self._loop.call_soon(self._update_callback, data)
-        else:
-            self.log.debug("No new data encountered")
+            # Poweron update, checked after the volume update so that a
+            # refresh started here is not resolved by the current datagram
+            if not self._poweron_refresh_successful and self.power:
+                self._poweron_callback()
+
+        if not newdata:
+            self._dbg("No new data encountered")
 
         if not recognized:
-            self.log.debug("Unrecognized response: %s", data)
+            self._dbg("Unrecognized response: %s", data)
 
-    def send_command(self, command, data=""):
-        command = f"#{command},{data}\r"
-        command = command.encode()
+        return newdata
 
-        self.log.debug("> %s", command)
+    def send_command(self, command, data="", repeat=1):
+        buf = ENCODED_COMMANDS.get(command) if data == "" else None
+        if buf is None:
+            buf = b"#%s,%s\r" % (command.encode(), str(data).encode())
+        if repeat > 1:
+            buf *= repeat
+
+        self._dbg("> %s", buf)
         try:
-            self.transport.write(command)
-            # time.sleep(0.01)
+            self._write(buf)
         except Exception:
-            self.log.warning("No transport found, unable to send command")
+            self._warn("No transport found, unable to send command")
 
     @property
     def attenuation(self):
@@ -426,22 +687,22 @@ class AVR(asyncio.Protocol):
         >>> attvalue = attenuation
         >>> attenuation = -50
         """
-        try:
-            return int(self._get_attribute_value(ATTR_VOLUME_UP))
-        except ValueError:
-            return -90
-        except NameError:
-            return -90
+        return self._volume_int
 
     @attenuation.setter
     def attenuation(self, value):
-        volume = self._get_integer(ATTR_VOLUME_UP)
-        if isinstance(value, int) and -90 <= value <= 0 and value != volume:
-            self.log.debug("Setting attenuation to " + str(value))
+        try:
+            value = int(value)
+        except (TypeError, ValueError, OverflowError):
+            return
+        # Steps still in flight stay counted, so retargeting mid-ramp
+        # continues from where those steps will leave the volume
+        if -90 <= value <= 0 and (
+            value != self._volume_int or self._volume_target is not None
+        ):
+            self._dbg("Setting attenuation to %s", value)
             self._volume_target = value
-            self.send_command(
-                CMD_VOLUME_UP if self._volume_target > volume else CMD_VOLUME_DOWN
-            )
+            self._step_volume()
 
     @property
     def volume(self):
@@ -459,7 +720,11 @@ class AVR(asyncio.Protocol):
 
     @volume.setter
     def volume(self, value):
-        if isinstance(value, int) and 0 <= value <= 100:
+        try:
+            value = int(value)
+        except (TypeError, ValueError, OverflowError):
+            return
+        if 0 <= value <= 100:
             self.attenuation = volume_to_attenuation(value)
 
     @property
@@ -479,10 +744,12 @@ class AVR(asyncio.Protocol):
 
     @volume_as_percentage.setter
     def volume_as_percentage(self, value):
-        if isinstance(value, float) or isinstance(value, int):
-            if 0 <= value <= 1:
-                value = round(value * 100)
-                self.volume = value
+        try:
+            value = float(value)
+        except (TypeError, ValueError, OverflowError):
+            return
+        if 0 <= value <= 1:
+            self.volume = round(value * 100)
 
     #
     # Boolean properties and corresponding setters
@@ -493,7 +760,7 @@ class AVR(asyncio.Protocol):
 
         Returns and expects a boolean value.
         """
-        return self._get_boolean(ATTR_POWER_STATE)
+        return self._power_bool
 
     @power.setter
     def power(self, value):
@@ -504,7 +771,7 @@ class AVR(asyncio.Protocol):
     @property
     def mute(self):
         """Mute on or off (read/write)."""
-        return self._get_boolean(ATTR_MUTE_STATE)
+        return self._mute_bool
 
     @mute.setter
     def mute(self, value):
@@ -542,9 +809,10 @@ class AVR(asyncio.Protocol):
 
     @input_name.setter
     def input_name(self, value):
-        number = INPUT_NUMBERS.get(value, 0)
-        if number > 0:
-            self.input_number = number
+        data = INPUT_DATA.get(value)
+        if data:
+            self._dbg("Switching input to %s", data)
+            self.send_command(CMD_SELECT_INPUT, data)
 
     @property
     def input_number(self):
@@ -553,7 +821,11 @@ class AVR(asyncio.Protocol):
 
     @input_number.setter
     def input_number(self, number):
-        if isinstance(number, int):
-            if 1 <= number <= 99:
-                self.log.debug("Switching input to " + f"{number:02d}")
-                self.send_command(CMD_SELECT_INPUT, f"{number:02d}")
+        try:
+            number = int(number)
+        except (TypeError, ValueError, OverflowError):
+            return
+        data = INPUT_DATA_BY_NUMBER.get(number)
+        if data:
+            self._dbg("Switching input to %s", data)
+            self.send_command(CMD_SELECT_INPUT, data)
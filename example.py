@@ -23,8 +23,8 @@ async def test():
 
     logging.basicConfig(level=level)
 
-    def log_callback(message):
-        log.info("Callback invoked: %s" % message)
+    def log_callback(messages):
+        log.info("Callback invoked: %s" % ", ".join(messages))
 
     host = args.host
     port = int(args.port)
@@ -0,0 +1,344 @@
+"""Tests for the AVR protocol handler."""
+import asyncio
+
+from cambridgeavr import protocol
+from cambridgeavr.protocol import AVR
+
+
+class FakeAVR:
+    """Transport standing in for the AVR's TCP/RS232 bridge.
+
+    Every volume step written to it changes the simulated volume and is
+    reported back to the protocol shortly after.  While ``replying`` is
+    False, commands are ignored, as the AVR does in standby.
+    """
+
+    def __init__(self, protocol, loop, attenuation=-40):
+        self.protocol = protocol
+        self.loop = loop
+        self.attenuation = attenuation
+        self.replying = True
+        self.written = []
+
+    def write(self, data):
+        self.written.append(data)
+        if not self.replying:
+            return
+        for command in data.split(b"\r"):
+            if command == b"#1,02,":
+                self.attenuation = min(0, self.attenuation + 1)
+                self.reply(b"#6,02,%d\r" % self.attenuation)
+            elif command == b"#1,03,":
+                self.attenuation = max(-90, self.attenuation - 1)
+                self.reply(b"#6,03,%d\r" % self.attenuation)
+
+    def reply(self, data):
+        self.loop.call_later(0.001, self.feed, data)
+
+    def feed(self, data):
+        while data:
+            buf = self.protocol.get_buffer(-1)
+            nbytes = min(len(buf), len(data))
+            buf[:nbytes] = data[:nbytes]
+            self.protocol.buffer_updated(nbytes)
+            data = data[nbytes:]
+
+    def get_write_buffer_limits(self):
+        return (0, 0)
+
+    def close(self):
+        pass
+
+    def steps_sent(self):
+        return sum(data.count(b"\r") for data in self.written)
+
+
+def run_with_avr(test, attenuation=-40):
+    """Run coroutine function ``test(avr, device)`` against a FakeAVR."""
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        avr = AVR(loop=loop)
+        device = FakeAVR(avr, loop, attenuation)
+        avr.connection_made(device)
+        avr._poweron_refresh_successful = True
+        device.feed(b"#6,02,%d\r" % attenuation)
+        await test(avr, device)
+
+    asyncio.run(main())
+
+
+async def settle(delay=0.2):
+    await asyncio.sleep(delay)
+
+
+def test_volume_sweep_batches_steps():
+    async def test(avr, device):
+        loop = asyncio.get_running_loop()
+        timers = []
+        call_at = loop.call_at
+
+        def counting_call_at(when, callback, *args, **kwargs):
+            if callback == avr._check_volume_steps:
+                timers.append(when)
+            return call_at(when, callback, *args, **kwargs)
+
+        loop.call_at = counting_call_at
+
+        avr.attenuation = -10
+        await settle()
+        assert len(timers) == 1
+        assert device.attenuation == -10
+        assert avr.attenuation == -10
+        assert avr._volume_target is None
+        assert avr._volume_steps == 0
+        assert device.steps_sent() == 30
+        assert len(device.written) < 30
+
+    run_with_avr(test)
+
+
+def test_volume_direction_change():
+    async def test(avr, device):
+        avr.attenuation = -10
+        await asyncio.sleep(0.005)
+        avr.attenuation = -60
+        await settle()
+        assert device.attenuation == -60
+        assert avr.attenuation == -60
+        assert avr._volume_target is None
+        assert avr._volume_steps == 0
+
+    run_with_avr(test)
+
+
+def test_volume_steps_expire_without_replies(monkeypatch):
+    monkeypatch.setattr(protocol, "VOLUME_STEP_TIMEOUT", 0.05)
+
+    async def test(avr, device):
+        device.replying = False
+        avr.attenuation = -30
+        assert avr._volume_steps == protocol.VOLUME_STEP_BATCH
+        await settle()
+        assert avr._volume_steps == 0
+        assert avr._volume_target is None
+
+        device.replying = True
+        avr.attenuation = -50
+        await settle()
+        assert avr.attenuation == -50
+
+    run_with_avr(test)
+
+
+def test_volume_setter_retries_after_steps_expire(monkeypatch):
+    monkeypatch.setattr(protocol, "VOLUME_STEP_TIMEOUT", 0.05)
+
+    async def test(avr, device):
+        device.replying = False
+        avr.attenuation = -30
+        sent = len(device.written)
+        avr.attenuation = -30
+        assert len(device.written) == sent
+
+        await settle()
+        device.replying = True
+        avr.attenuation = -30
+        assert len(device.written) > sent
+        await settle()
+        assert device.attenuation == -30
+        assert avr.attenuation == -30
+
+    run_with_avr(test)
+
+
+def test_volume_back_to_back_targets():
+    for targets, final in (
+        ((-10, -20), -20),
+        ((-30, -32, -34, -36), -36),
+        (range(-39, -19), -20),
+        ((-10, -40), -40),
+    ):
+
+        async def test(avr, device):
+            for target in targets:
+                avr.attenuation = target
+            await settle()
+            assert device.attenuation == final
+            assert avr.attenuation == final
+            assert avr._volume_target is None
+            assert avr._volume_steps == 0
+
+        run_with_avr(test)
+
+
+def test_volume_slider_sweep_while_ramping():
+    async def test(avr, device):
+        for target in range(-39, -19):
+            avr.attenuation = target
+            await asyncio.sleep(0.002)
+        await settle()
+        assert device.attenuation == -20
+        assert avr.attenuation == -20
+
+    run_with_avr(test)
+
+
+def test_unrelated_error_reply_keeps_volume_ramp():
+    async def test(avr, device):
+        avr.attenuation = -30
+        device.feed(b"#11,03\r")
+        await settle()
+        assert device.attenuation == -30
+        assert avr.attenuation == -30
+        assert avr._volume_target is None
+
+    run_with_avr(test)
+
+
+def test_update_callback_receives_batch():
+    updates = []
+
+    async def test(avr, device):
+        avr._update_callback = updates.append
+        device.feed(b"#6,01,1\r#6,11,01\r#6,01,1\r")
+
+    run_with_avr(test)
+    assert updates == [["#6,01,1", "#6,11,01"]]
+
+
+def test_update_callback_errors_are_logged(caplog):
+    def callback(changed):
+        raise RuntimeError("boom")
+
+    async def test(avr, device):
+        avr._update_callback = callback
+        device.feed(b"#6,01,1\r")
+        assert avr.power
+
+    run_with_avr(test)
+    assert "Error in update callback" in caplog.text
+
+
+def test_volume_refresh_resends_probe(monkeypatch):
+    monkeypatch.setattr(protocol, "VOLUME_REFRESH_INTERVAL", 0.05)
+
+    async def test(avr, device):
+        device.replying = False
+        avr._refresh_volume()
+        await asyncio.sleep(0.01)
+        device.replying = True
+        await settle()
+        assert avr._volume_refresh.result() is None
+        assert device.written.count(b"#1,03,\r") == 2
+        assert device.written[-1] == b"#1,02,\r"
+
+    run_with_avr(test)
+
+
+def test_volume_refresh_gives_up(monkeypatch):
+    monkeypatch.setattr(protocol, "VOLUME_REFRESH_INTERVAL", 0.001)
+
+    async def test(avr, device):
+        device.replying = False
+        avr._refresh_volume()
+        await settle(0.1)
+        assert avr._volume_refresh.cancelled()
+        assert len(device.written) == protocol.VOLUME_REFRESH_TRIES
+
+    run_with_avr(test)
+
+
+def test_send_command_accepts_non_string_data():
+    async def test(avr, device):
+        avr.send_command("1,10", 5)
+        assert device.written[-1] == b"#1,10,5\r"
+        avr.send_command(protocol.CMD_VOLUME_UP, 0)
+        assert device.written[-1] == b"#1,02,0\r"
+
+    run_with_avr(test)
+
+
+def test_setters_ignore_invalid_values():
+    async def test(avr, device):
+        sent = len(device.written)
+        for value in (float("inf"), float("nan"), None, "loud"):
+            avr.attenuation = value
+            avr.volume = value
+            avr.volume_as_percentage = value
+            avr.input_number = value
+        assert len(device.written) == sent
+
+    run_with_avr(test)
+
+
+def test_non_ascii_datagrams_are_decoded():
+    async def test(avr, device):
+        device.feed("#10,01,v1.2-ü\r".encode() + b"#7,04,\xff\r#6,01,1\r")
+        assert avr.sw_version == "v1.2-ü"
+        assert avr._audio_source == "�"
+        assert avr.power
+
+    run_with_avr(test)
+
+
+def test_receive_buffer_discards_unterminated_data(caplog):
+    async def test(avr, device):
+        device.feed(b"#10,01,")
+        while avr._wpos:
+            device.feed(b"x" * 4096)
+        assert "Discarding" in caplog.text
+        assert len(avr._buf) <= 2 * (protocol.MAX_DATAGRAM_SIZE + 4096)
+
+        device.feed(b"\r#6,01,1\r")
+        assert avr.power
+        assert len(avr._buf) == protocol.RECEIVE_BUFFER_SIZE
+
+    run_with_avr(test)
+
+
+def test_receive_buffer_keeps_minimum_free_space():
+    async def test(avr, device):
+        device.feed(b"#6,02,-40\r" * 800 + b"#6,0")
+        assert len(avr.get_buffer(-1)) >= protocol.MIN_READ_SIZE
+
+    run_with_avr(test)
+
+
+def test_datagrams_split_across_reads_are_reassembled():
+    async def test(avr, device):
+        for byte in b"#6,01,1\r#6,02,-30\r":
+            device.feed(bytes([byte]))
+        assert avr.power
+        assert avr.attenuation == -30
+        assert avr._rpos == avr._wpos == 0
+
+    run_with_avr(test)
+
+
+def test_receive_buffer_compacts_pending_tail():
+    async def test(avr, device):
+        data = b"#6,02,-40\r" * 500 + b"#6,0"
+        buf = avr.get_buffer(-1)
+        buf[: len(data)] = data
+        avr.buffer_updated(len(data))
+        assert avr._rpos == 0
+        assert avr._buf[: avr._wpos] == b"#6,0"
+
+        device.feed(b"1,1\r")
+        assert avr.power
+
+    run_with_avr(test)
+
+
+def test_receive_buffer_grows_for_oversize_datagram():
+    async def test(avr, device):
+        version = b"v" * (2 * protocol.RECEIVE_BUFFER_SIZE)
+        device.feed(b"#10,01,")
+        device.feed(version)
+        assert len(avr._buf) > protocol.RECEIVE_BUFFER_SIZE
+        device.feed(b"\r")
+        assert avr.sw_version == version.decode()
+        assert len(avr._buf) == protocol.RECEIVE_BUFFER_SIZE
+
+    run_with_avr(test)